@@ -28,6 +28,11 @@ class FixedDiceRoller:
         assert roller.roll() == 2
         assert roller.roll() == 3  # Cycles back to start
 
+        # Bulk mode - same sequence as repeated roll() calls
+        roller = FixedDiceRoller([3, 5, 2])
+        assert roller.roll_many(4) == [3, 5, 2, 3]
+        assert roller.roll() == 5
+
     Attributes:
         _values: List of predetermined values to return
         _index: Current position in the sequence
@@ -65,6 +70,24 @@ class FixedDiceRoller:
         self._index += 1
         return value
 
+    def roll_many(self, n: int) -> list[int]:
+        """Return the next n predetermined values from the sequence.
+
+        Args:
+            n: Number of dice to roll (>= 0)
+
+        Returns:
+            List of n integers, identical to calling roll() n times.
+            The sequence position advances by n, so roll() and roll_many()
+            can be interleaved freely.
+
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError("Number of rolls cannot be negative")
+        return [self.roll() for _ in range(n)]
+
     def reset(self) -> None:
         """Reset sequence index to beginning.
 